@@ -9,9 +9,14 @@ from dotenv import load_dotenv, dotenv_values
 # This avoids common issues where the working directory differs or the file has a BOM.
 ENV_PATH = Path(__file__).resolve().parent / ".env"
 if ENV_PATH.exists():
-    # override=True so changes to .env take effect even if an env var was set elsewhere
-    load_dotenv(dotenv_path=ENV_PATH, override=True, encoding="utf-8-sig")
+    # Parse the file once and apply the values ourselves; the previous
+    # load_dotenv + dotenv_values fallback tokenized the same file twice.
+    # Overriding existing env vars keeps the old override=True semantics
+    # (changes to .env take effect even if a var was set elsewhere).
+    _env_values = dotenv_values(ENV_PATH, encoding="utf-8-sig")
+    os.environ.update({k: v for k, v in _env_values.items() if v is not None})
 else:
+    _env_values = {}
     load_dotenv()
 
 # API Configuration
@@ -29,16 +34,18 @@ def _normalize_api_key(value: str) -> str:
         v = v[1:-1].strip()
     return v
 
-# Prefer process env var; if missing, try reading .env directly as a fallback.
-_raw_api_key = os.getenv("API_KEY")
-if not _raw_api_key and ENV_PATH.exists():
-    _raw_api_key = dotenv_values(ENV_PATH, encoding="utf-8-sig").get("API_KEY")
+# Prefer process env var; if missing, fall back to the values already
+# parsed above instead of reopening the .env file.
+_raw_api_key = os.getenv("API_KEY") or _env_values.get("API_KEY")
 
 API_KEY = _normalize_api_key(_raw_api_key or "your-secret-api-key-change-in-production")
 API_KEY_HEADER = "x-api-key"
 
 # Supported languages
+# Keep the list for ordered JSON responses; the frozenset is for O(1)
+# membership checks on the request path.
 SUPPORTED_LANGUAGES = ["Tamil", "English", "Hindi", "Malayalam", "Telugu"]
+SUPPORTED_LANGUAGES_SET = frozenset(SUPPORTED_LANGUAGES)
 
 # Audio configuration
 SUPPORTED_AUDIO_FORMATS = ["mp3"]
@@ -1,10 +1,16 @@
 """
 API Key authentication middleware
 """
+import hmac
+
 from fastapi import HTTPException, Header, status
 from typing import Annotated
 import config
 
+# Normalize the expected key once at import time; avoids re-running
+# str()+strip() (and the config attribute lookup) on every request.
+_EXPECTED_KEY = config.API_KEY.strip().encode()
+
 
 async def verify_api_key(x_api_key: Annotated[str | None, Header(alias="x-api-key")] = None) -> str:
     """
@@ -25,10 +31,10 @@ async def verify_api_key(x_api_key: Annotated[str | None, Header(alias="x-api-ke
             detail="Missing API key. Please provide x-api-key header."
         )
     
-    # Normalize to avoid accidental whitespace/quote mismatches from clients or env files
+    # Normalize to avoid accidental whitespace/quote mismatches from clients or env files.
+    # hmac.compare_digest keeps the comparison constant-time.
     provided = x_api_key.strip()
-    expected = str(config.API_KEY).strip()
-    if provided != expected:
+    if not hmac.compare_digest(provided.encode(), _EXPECTED_KEY):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key"
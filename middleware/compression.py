@@ -0,0 +1,94 @@
+"""
+Request-body decompression middleware
+
+Starlette's GZipMiddleware only compresses responses; clients sending
+`Content-Encoding: gzip` request bodies (the CLI does this for the large
+base64 payloads) need the body inflated before routing/validation sees it.
+"""
+import zlib
+
+from starlette.responses import JSONResponse
+
+import config
+
+# Cap on the inflated body size. The largest legitimate payload is the
+# JSON request carrying a max-size audio file as base64 (4/3 expansion),
+# plus a little headroom for the other JSON fields. Inflating past this
+# is aborted mid-stream, so a small gzip bomb cannot balloon in memory
+# before the route-level size check runs.
+_MAX_INFLATED = int(config.MAX_AUDIO_SIZE_MB * 1024 * 1024 * 4 / 3) + 64 * 1024
+
+
+class GzipRequestMiddleware:
+    """ASGI middleware that transparently inflates gzip request bodies"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = next(
+            (v for k, v in scope["headers"] if k == b"content-encoding"), b""
+        )
+        if encoding.lower() != b"gzip":
+            await self.app(scope, receive, send)
+            return
+
+        # Inflate incrementally as chunks arrive, bailing out the moment
+        # the output exceeds the cap instead of decompressing everything
+        # and checking afterwards. wbits=MAX_WBITS|16 selects gzip framing.
+        inflater = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        data = bytearray()
+        more_body = True
+        try:
+            while more_body:
+                message = await receive()
+                more_body = message.get("more_body", False)
+                chunk = message.get("body", b"")
+                if chunk:
+                    data += inflater.decompress(chunk, _MAX_INFLATED + 1 - len(data))
+                    if len(data) > _MAX_INFLATED:
+                        response = JSONResponse(
+                            status_code=413,
+                            content={
+                                "status": "error",
+                                "message": "Decompressed request body too large",
+                            },
+                        )
+                        await response(scope, receive, send)
+                        return
+            data += inflater.flush()
+        except zlib.error:
+            inflater = None
+        if inflater is None or not inflater.eof:
+            response = JSONResponse(
+                status_code=400,
+                content={"status": "error", "message": "Invalid gzip request body"},
+            )
+            await response(scope, receive, send)
+            return
+        data = bytes(data)
+
+        # Rewrite headers so downstream sees a plain body of the right length
+        headers = [
+            (k, v)
+            for k, v in scope["headers"]
+            if k not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(data)).encode("latin-1")))
+        scope = dict(scope)
+        scope["headers"] = headers
+
+        sent = False
+
+        async def inflated_receive():
+            nonlocal sent
+            if sent:
+                return {"type": "http.disconnect"}
+            sent = True
+            return {"type": "http.request", "body": data, "more_body": False}
+
+        await self.app(scope, inflated_receive, send)
@@ -1,9 +1,15 @@
 """
 Pydantic models for API request/response
 """
+import re
+
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from typing import Literal
 
+# Base64 alphabet with optional trailing padding; used for cheap validation
+# without decoding the (potentially multi-MB) payload.
+_B64_RE = re.compile(rb'^[A-Za-z0-9+/]*={0,2}$')
+
 
 class VoiceDetectionRequest(BaseModel):
     """Request model for voice detection API"""
@@ -39,11 +45,14 @@ class VoiceDetectionRequest(BaseModel):
         """Validate Base64 string"""
         if not v or len(v) == 0:
             raise ValueError("audioBase64 cannot be empty")
-        # Basic Base64 validation
+        # Cheap structural check (alphabet + length). A full b64decode here
+        # would decode megabytes only to throw the result away, doubling the
+        # decode work since the endpoint decodes again for real.
         try:
-            import base64
-            base64.b64decode(v, validate=True)
-        except Exception:
+            b = v.encode("ascii")
+        except UnicodeEncodeError:
+            raise ValueError("Invalid Base64 encoding")
+        if len(b) % 4 or not _B64_RE.match(b):
             raise ValueError("Invalid Base64 encoding")
         return v
 
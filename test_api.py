@@ -1,7 +1,9 @@
 """
 Simple test script for the Voice Detection API
 """
+import atexit
 import requests
+from requests.adapters import HTTPAdapter
 import base64
 import json
 import sys
@@ -14,6 +16,18 @@ from dotenv import load_dotenv
 load_dotenv()
 API_KEY = os.getenv("API_KEY", "your-secret-api-key-change-in-production")
 
+# Shared session with connection pooling so repeated test calls reuse
+# keep-alive connections instead of re-handshaking every time.
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+_SESSION.headers.update({
+    "x-api-key": API_KEY,
+    "Content-Type": "application/json",
+})
+atexit.register(_SESSION.close)
+
 
 def encode_audio_to_base64(audio_path: str) -> str:
     """
@@ -26,9 +40,14 @@ def encode_audio_to_base64(audio_path: str) -> str:
         Base64-encoded string
     """
     try:
+        # Read and encode in 3-byte-aligned chunks so each block produces
+        # padding-free base64; avoids keeping raw bytes + encoded string
+        # in memory simultaneously for large files.
+        buf = bytearray()
         with open(audio_path, "rb") as audio_file:
-            audio_bytes = audio_file.read()
-            return base64.b64encode(audio_bytes).decode("utf-8")
+            while chunk := audio_file.read(3 * 4096):
+                buf += base64.b64encode(chunk)
+        return buf.decode("ascii")
     except FileNotFoundError:
         print(f"Error: Audio file not found: {audio_path}")
         sys.exit(1)
@@ -62,15 +81,10 @@ def test_voice_detection(audio_path: str, language: str = "Tamil"):
         "audioBase64": audio_base64
     }
     
-    headers = {
-        "x-api-key": API_KEY,
-        "Content-Type": "application/json"
-    }
-    
-    # Make API request
+    # Make API request (headers are set once on the shared session)
     print("\nSending request to API...")
     try:
-        response = requests.post(API_URL, json=payload, headers=headers)
+        response = _SESSION.post(API_URL, json=payload)
         
         print(f"Status Code: {response.status_code}")
         print("\nResponse:")
@@ -107,7 +121,7 @@ if __name__ == "__main__":
     language = sys.argv[2] if len(sys.argv) > 2 else "Tamil"
     
     # Validate language
-    supported_languages = ["Tamil", "English", "Hindi", "Malayalam", "Telugu"]
+    supported_languages = ("Tamil", "English", "Hindi", "Malayalam", "Telugu")
     if language not in supported_languages:
         print(f"Error: Unsupported language '{language}'")
         print(f"Supported languages: {', '.join(supported_languages)}")